@@ -167,7 +167,7 @@ AXIS_TYPES = [
     'category'
 ]
 
-SUPPORTED_CURSOR_VALUES = [
+SUPPORTED_CURSOR_VALUES = frozenset({
     'alias',
     'all-scroll',
     'auto',
@@ -204,7 +204,7 @@ SUPPORTED_CURSOR_VALUES = [
     'wait',
     'zoom-in',
     'zoom-out'
-]
+})
 SUPPORTED_DASH_STYLE_VALUES = [
     'Dash',
     'DashDot',
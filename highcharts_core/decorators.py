@@ -8,6 +8,39 @@ from validator_collection import checkers
 from highcharts_core import errors, constants
 
 
+def _get_types_list(types):
+    """Normalize ``types`` into a :class:`list <python:list>` of
+    :class:`type <python:type>` objects.
+
+    :param types: :class:`type <python:type>` object or iterable of
+      :class:`type <python:type>` objects.
+    :type types: :class:`type <python:type>` or iterable of :class:`type <python:type>`
+
+    :rtype: :class:`list <python:list>` of :class:`type <python:type>`
+
+    :raises HighchartsImplementationError: if ``types`` is empty
+
+    :raises HighchartsValueError: if ``types`` does not contain a
+      :class:`type <python:type>` or iterable of :class:`type <python:type>` objects
+
+    """
+    if not types:
+        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
+                                         'iterable of types')
+
+    try:
+        types_list = [x for x in types]
+    except TypeError:
+        types_list = [types]
+
+    for item in types_list:
+        if not isinstance(item, type):
+            raise errors.HighchartsValueError(f'types must contain one or more type '
+                                              f'objects. Received a {type(item)}.')
+
+    return types_list
+
+
 def validate_types(value,
                    types = None,
                    allow_dict = True,
@@ -66,23 +99,7 @@ def validate_types(value,
       :class:`HighchartsMeta` interface definition
 
     """
-    if not types:
-        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
-                                         'iterable of types')
-
-    if not types:
-        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
-                                         'iterable of types')
-
-    try:
-        types_list = [x for x in types]
-    except TypeError:
-        types_list = [types]
-
-    for item in types_list:
-        if not isinstance(item, type):
-            raise errors.HighchartsValueError(f'types must contain one or more type '
-                                              f'objects. Received a {type(item)}.')
+    types_list = _get_types_list(types)
 
     primary_type = types_list[0]
     if not hasattr(primary_type, 'from_js_literal'):
@@ -245,6 +262,13 @@ def class_sensitive(types = None,
       :class:`HighchartsMeta` interface definition
 
     """
+    # Resolve the primary type once, when the decorator is applied, rather than on
+    # every call. Invalid ``types`` are left for validate_types() to report.
+    try:
+        primary_type = _get_types_list(types)[0]
+    except (errors.HighchartsImplementationError, errors.HighchartsValueError):
+        primary_type = None
+
     def decorator(func):
         @wraps(func)
         def func_wrapper(*args,
@@ -257,6 +281,16 @@ def class_sensitive(types = None,
                 raise errors.HighchartsError('Something went wrong. Unsure how this '
                                              'might happen.')
 
+            if value is None and allow_none:
+                return func(args[0], value)
+            if (
+                primary_type is not None and
+                not force_iterable and
+                type(value) is primary_type and
+                value
+            ):
+                return func(args[0], value)
+
             value = validate_types(value,
                                    types = types,
                                    allow_dict = allow_dict,
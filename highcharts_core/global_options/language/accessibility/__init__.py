@@ -1,10 +1,10 @@
 from typing import Optional
-
-from validator_collection import validators
+from functools import wraps
 
 from highcharts_core import constants
 from highcharts_core.decorators import class_sensitive
-from highcharts_core.metaclasses import HighchartsMeta
+from highcharts_core.metaclasses import HighchartsMeta, UntrimmedFieldTableMixin
+from highcharts_core.utility_functions import validate_string
 from highcharts_core.global_options.language.accessibility.announce_new_data import AnnounceNewDataLanguageOptions
 from highcharts_core.global_options.language.accessibility.axis import AxisLanguageOptions
 from highcharts_core.global_options.language.accessibility.chart_types import ChartTypesLanguageOptions
@@ -19,7 +19,19 @@ from highcharts_core.global_options.language.accessibility.zoom import ZoomLangu
 from highcharts_core.global_options.language.accessibility.navigator import NavigatorLanguageOptions
 
 
-class AccessibilityLanguageOptions(HighchartsMeta):
+def _invalidates_cache(func):
+    """Discard the instance's cached untrimmed :class:`dict <python:dict>` whenever the
+    decorated property setter is called."""
+    @wraps(func)
+    def func_wrapper(self, value):
+        self._cached_dict = None
+
+        return func(self, value)
+
+    return func_wrapper
+
+
+class AccessibilityLanguageOptions(UntrimmedFieldTableMixin, HighchartsMeta):
     """Configuration of accessibility strings in the chart.
 
     .. note::
@@ -33,50 +45,47 @@ class AccessibilityLanguageOptions(HighchartsMeta):
 
     """
 
+    # (Python property name, Highcharts JS key) for each option, in serialization order.
+    _FIELDS = (
+        ('announce_new_data', 'announceNewData'),
+        ('axis', 'axis'),
+        ('chart_container_label', 'chartContainerLabel'),
+        ('chart_types', 'chartTypes'),
+        ('credits', 'credits'),
+        ('default_chart_title', 'defaultChartTitle'),
+        ('drillup_button', 'drillUpButton'),
+        ('exporting', 'exporting'),
+        ('graphic_container_label', 'graphicContainerLabel'),
+        ('legend', 'legend'),
+        ('navigator', 'navigator'),
+        ('range_selector', 'rangeSelector'),
+        ('screen_reader_section', 'screenReaderSection'),
+        ('series', 'series'),
+        ('series_type_descriptions', 'seriesTypeDescriptions'),
+        ('sonification', 'sonification'),
+        ('svg_container_label', 'svgContainerLabel'),
+        ('svg_container_title', 'svgContainerTitle'),
+        ('table', 'table'),
+        ('thousands_separator', 'thousandsSep'),
+        ('zoom', 'zoom'),
+    )
+
+    __slots__ = ('_cached_dict',) + tuple(f'_{name}' for name, _ in _FIELDS)
+
     def __init__(self, **kwargs):
-        self._announce_new_data = None
-        self._axis = None
-        self._chart_container_label = None
-        self._chart_types = None
-        self._credits = None
-        self._default_chart_title = None
-        self._drillup_button = None
-        self._exporting = None
-        self._graphic_container_label = None
-        self._legend = None
-        self._navigator = None
-        self._range_selector = None
-        self._screen_reader_section = None
-        self._series = None
-        self._series_type_descriptions = None
-        self._sonification = None
-        self._svg_container_label = None
-        self._svg_container_title = None
-        self._table = None
-        self._thousands_separator = None
-        self._zoom = None
-
-        self.announce_new_data = kwargs.get('announce_new_data', None)
-        self.axis = kwargs.get('axis', None)
-        self.chart_container_label = kwargs.get('chart_container_label', None)
-        self.chart_types = kwargs.get('chart_types', None)
-        self.credits = kwargs.get('credits', None)
-        self.default_chart_title = kwargs.get('default_chart_title', None)
-        self.drillup_button = kwargs.get('drillup_button', None)
-        self.exporting = kwargs.get('exporting', None)
-        self.graphic_container_label = kwargs.get('graphic_container_label', None)
-        self.legend = kwargs.get('legend', None)
-        self.navigator = kwargs.get('navigator', None)
-        self.range_selector = kwargs.get('range_selector', None)
-        self.screen_reader_section = kwargs.get('screen_reader_section', None)
-        self.series = kwargs.get('series', None)
-        self.series_type_description = kwargs.get('series_type_description', None)
-        self.sonification = kwargs.get('sonification', None)
-        self.svg_container_label = kwargs.get('svg_container_label', None)
-        self.svg_container_title = kwargs.get('svg_container_title', None)
-        self.table = kwargs.get('table', None)
-        self.thousands_separator = kwargs.get('thousands_separator', None)
-        self.zoom = kwargs.get('zoom', None)
+        self._cached_dict = None
+
+        # Every setter maps None to None, so only supplied values need validating.
+        for name, _ in self._FIELDS:
+            value = kwargs.get(name, None)
+            if value is None:
+                setattr(self, f'_{name}', None)
+            else:
+                setattr(self, name, value)
+
+        legacy_descriptions = kwargs.get('series_type_description', None)
+        if legacy_descriptions is not None and self._series_type_descriptions is None:
+            self.series_type_descriptions = legacy_descriptions
 
     @property
     def announce_new_data(self) -> Optional[AnnounceNewDataLanguageOptions]:
@@ -99,6 +108,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._announce_new_data
 
     @announce_new_data.setter
+    @_invalidates_cache
     @class_sensitive(AnnounceNewDataLanguageOptions)
     def announce_new_data(self, value):
         self._announce_new_data = value
@@ -112,6 +122,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._axis
 
     @axis.setter
+    @_invalidates_cache
     @class_sensitive(AxisLanguageOptions)
     def axis(self, value):
         self._axis = value
@@ -126,8 +137,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._chart_container_label
 
     @chart_container_label.setter
+    @_invalidates_cache
     def chart_container_label(self, value):
-        self._chart_container_label = validators.string(value, allow_empty = True)
+        self._chart_container_label = validate_string(value)
 
     @property
     def chart_types(self) -> Optional[ChartTypesLanguageOptions]:
@@ -147,6 +159,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._chart_types
 
     @chart_types.setter
+    @_invalidates_cache
     @class_sensitive(ChartTypesLanguageOptions)
     def chart_types(self, value):
         self._chart_types = value
@@ -161,8 +174,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._credits
 
     @credits.setter
+    @_invalidates_cache
     def credits(self, value):
-        self._credits = validators.string(value, allow_empty = True)
+        self._credits = validate_string(value)
 
     @property
     def default_chart_title(self) -> Optional[str]:
@@ -174,8 +188,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._default_chart_title
 
     @default_chart_title.setter
+    @_invalidates_cache
     def default_chart_title(self, value):
-        self._default_chart_title = validators.string(value, allow_empty = True)
+        self._default_chart_title = validate_string(value)
 
     @property
     def drillup_button(self) -> Optional[str]:
@@ -187,8 +202,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._drillup_button
 
     @drillup_button.setter
+    @_invalidates_cache
     def drillup_button(self, value):
-        self._drillup_button = validators.string(value, allow_empty = True)
+        self._drillup_button = validate_string(value)
 
     @property
     def exporting(self) -> Optional[ExportingLanguageOptions]:
@@ -199,6 +215,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._exporting
 
     @exporting.setter
+    @_invalidates_cache
     @class_sensitive(ExportingLanguageOptions)
     def exporting(self, value):
         self._exporting = value
@@ -214,8 +231,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._graphic_container_label
 
     @graphic_container_label.setter
+    @_invalidates_cache
     def graphic_container_label(self, value):
-        self._graphic_container_label = validators.string(value, allow_empty = True)
+        self._graphic_container_label = validate_string(value)
 
     @property
     def legend(self) -> Optional[LegendLanguageOptions]:
@@ -226,6 +244,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._legend
 
     @legend.setter
+    @_invalidates_cache
     @class_sensitive(LegendLanguageOptions)
     def legend(self, value):
         self._legend = value
@@ -239,6 +258,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._navigator
     
     @navigator.setter
+    @_invalidates_cache
     @class_sensitive(NavigatorLanguageOptions)
     def navigator(self, value):
         self._navigator = value
@@ -252,6 +272,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._range_selector
 
     @range_selector.setter
+    @_invalidates_cache
     @class_sensitive(RangeSelectorLanguageOptions)
     def range_selector(self, value):
         self._range_selector = value
@@ -266,6 +287,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._screen_reader_section
 
     @screen_reader_section.setter
+    @_invalidates_cache
     @class_sensitive(ScreenReaderSectionLanguageOptions)
     def screen_reader_section(self, value):
         self._screen_reader_section = value
@@ -284,6 +306,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._series
 
     @series.setter
+    @_invalidates_cache
     @class_sensitive(SeriesLanguageOptions)
     def series(self, value):
         self._series = value
@@ -298,6 +321,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._series_type_descriptions
 
     @series_type_descriptions.setter
+    @_invalidates_cache
     @class_sensitive(SeriesTypeDescriptions)
     def series_type_descriptions(self, value):
         self._series_type_descriptions = value
@@ -312,6 +336,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._sonification
 
     @sonification.setter
+    @_invalidates_cache
     @class_sensitive(SonificationLanguageOptions)
     def sonification(self, value):
         self._sonification = value
@@ -326,8 +351,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._svg_container_label
 
     @svg_container_label.setter
+    @_invalidates_cache
     def svg_container_label(self, value):
-        self._svg_container_label = validators.string(value, allow_empty = True)
+        self._svg_container_label = validate_string(value)
 
     @property
     def svg_container_title(self) -> Optional[str]:
@@ -346,8 +372,9 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._svg_container_title
 
     @svg_container_title.setter
+    @_invalidates_cache
     def svg_container_title(self, value):
-        self._svg_container_title = validators.string(value, allow_empty = True)
+        self._svg_container_title = validate_string(value)
 
     @property
     def table(self) -> Optional[TableLanguageOptions]:
@@ -359,6 +386,7 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._table
 
     @table.setter
+    @_invalidates_cache
     @class_sensitive(TableLanguageOptions)
     def table(self, value):
         self._table = value
@@ -382,13 +410,14 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._thousands_separator
 
     @thousands_separator.setter
+    @_invalidates_cache
     def thousands_separator(self, value):
         if not value:
             self._thousands_separator = None
         elif isinstance(value, constants.EnforcedNullType):
             self._thousands_separator = constants.EnforcedNull
         else:
-            self._thousands_separator = validators.string(value, allow_empty = True)
+            self._thousands_separator = validate_string(value)
 
     @property
     def zoom(self) -> Optional[ZoomLanguageOptions]:
@@ -400,64 +429,24 @@ class AccessibilityLanguageOptions(HighchartsMeta):
         return self._zoom
 
     @zoom.setter
+    @_invalidates_cache
     @class_sensitive(ZoomLanguageOptions)
     def zoom(self, value):
         self._zoom = value
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'announce_new_data': as_dict.get('announceNewData', None),
-            'axis': as_dict.get('axis', None),
-            'chart_container_label': as_dict.get('chartContainerLabel', None),
-            'chart_types': as_dict.get('chartTypes', None),
-            'credits': as_dict.get('credits', None),
-            'default_chart_title': as_dict.get('defaultChartTitle', None),
-            'drillup_button': as_dict.get('drillUpButton', None),
-            'exporting': as_dict.get('exporting', None),
-            'graphic_container_label': as_dict.get('graphicContainerLabel', None),
-            'legend': as_dict.get('legend', None),
-            'navigator': as_dict.get('navigator', None),
-            'range_selector': as_dict.get('rangeSelector', None),
-            'screen_reader_section': as_dict.get('screenReaderSection', None),
-            'series': as_dict.get('series', None),
-            'series_type_description': as_dict.get('seriesTypeDescription', None),
-            'sonification': as_dict.get('sonification', None),
-            'svg_container_label': as_dict.get('svgContainerLabel', None),
-            'svg_container_title': as_dict.get('svgContainerTitle', None),
-            'table': as_dict.get('table', None),
-            'thousands_separator': as_dict.get('thousandsSep', None),
-            'zoom': as_dict.get('zoom', None)
-        }
+        kwargs = super()._get_kwargs_from_dict(as_dict)
+        if kwargs.get('series_type_descriptions', None) is None:
+            kwargs['series_type_descriptions'] = as_dict.get('seriesTypeDescription', None)
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'announceNewData': self.announce_new_data,
-            'axis': self.axis,
-            'chartContainerLabel': self.chart_container_label,
-            'chartTypes': self.chart_types,
-            'credits': self.credits,
-            'defaultChartTitle': self.default_chart_title,
-            'drillUpButton': self.drillup_button,
-            'exporting': self.exporting,
-            'graphicContainerLabel': self.graphic_container_label,
-            'legend': self.legend,
-            'navigator': self.navigator,
-            'rangeSelector': self.range_selector,
-            'screenReaderSection': self.screen_reader_section,
-            'series': self.series,
-            'seriesTypeDescription': self.series_type_description,
-            'sonification': self.sonification,
-            'svgContainerLabel': self.svg_container_label,
-            'svgContainerTitle': self.svg_container_title,
-            'table': self.table,
-            'thousandsSep': self.thousands_separator,
-            'zoom': self.zoom
-        }
-
-        return untrimmed
+        if self._cached_dict is None:
+            self._cached_dict = super()._to_untrimmed_dict(in_cls = in_cls)
+
+        return dict(self._cached_dict)
 
 
 __all__ = [
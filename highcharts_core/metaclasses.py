@@ -2,6 +2,8 @@
 import datetime
 from abc import ABC, abstractmethod
 from collections import UserDict
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional, List
 try:
     import orjson as json
@@ -34,6 +36,8 @@ class HighchartsMeta(ABC):
     """Metaclass that is used to define the standard interface exposed for serializable
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         for key in kwargs:
             setattr(self, key, kwargs.get(key, None))
@@ -88,8 +92,12 @@ class HighchartsMeta(ABC):
         if not scripts:
             scripts = []
         
+        attribute_names = list(getattr(self, '__dict__', {}))
+        for class_ in self.__class__.__mro__:
+            attribute_names.extend(class_.__dict__.get('__slots__', ()))
+
         properties = {}
-        for key in self.__dict__:
+        for key in attribute_names:
             if key[0] != '_':
                 continue
 
@@ -277,9 +285,15 @@ class HighchartsMeta(ABC):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
+        for key, value in untrimmed.items():
+            # None -> dropped
+            if value is None:
+                continue
+            # non-empty str / int / float -> as-is
+            if (type(value) is str and value) or type(value) in (int, float):
+                as_dict[key] = value
+                continue
             context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
             # bool -> Boolean
             if isinstance(value, bool):
                 as_dict[key] = value
@@ -368,6 +382,12 @@ class HighchartsMeta(ABC):
         """Convenience method which returns the keyword arguments used to initialize the
         class from a Highcharts Javascript-compatible :class:`dict <python:dict>` object.
 
+        .. note::
+
+          Implementations read from ``as_dict`` but must never modify it, as it may be
+          the (caller-owned) :class:`dict <python:dict>` supplied to
+          :meth:`.from_dict() <HighchartsMeta.from_dict>`.
+
         :param as_dict: The HighCharts JS compatible :class:`dict <python:dict>`
           representation of the object.
         :type as_dict: :class:`dict <python:dict>`
@@ -394,14 +414,13 @@ class HighchartsMeta(ABC):
         :returns: A Python object representation of ``as_dict``.
         :rtype: :class:`HighchartsMeta`
         """
-        as_dict = validators.dict(as_dict, allow_empty = True) or {}
-        clean_as_dict = {}
+        if type(as_dict) is not dict:
+            as_dict = validators.dict(as_dict, allow_empty = True) or {}
         if allow_snake_case:
             clean_as_dict = {utility_functions.to_camelCase(key): as_dict[key]
                              for key in as_dict}
         else:
-            clean_as_dict = {key: as_dict[key]
-                             for key in as_dict}
+            clean_as_dict = as_dict
 
         kwargs = cls._get_kwargs_from_dict(clean_as_dict)
 
@@ -804,6 +823,76 @@ class HighchartsMeta(ABC):
         return other
 
 
+class FieldTableMixin:
+    """Mixin which derives :meth:`._get_kwargs_from_dict() <HighchartsMeta._get_kwargs_from_dict>`
+    from a class-level ``_FIELDS`` table of ``(python_name, js_key)`` pairs.
+
+    Classes using the mixin declare only ``_FIELDS``. The read-only lookup from
+    Highcharts JS key to Python property name is built once, when the class is created.
+
+    .. note::
+
+      The mixin must precede :class:`HighchartsMeta` (or its subclasses) in the list of
+      base classes.
+    """
+
+    __slots__ = ()
+
+    _FIELDS = ()
+    _FIELDS_BY_JS_KEY = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '_FIELDS' in cls.__dict__:
+            cls._FIELDS_BY_JS_KEY = MappingProxyType({
+                js_key: name for name, js_key in cls._FIELDS
+            })
+
+    @classmethod
+    def _get_kwargs_from_dict(cls, as_dict):
+        fields_by_js_key = cls._FIELDS_BY_JS_KEY
+        kwargs = {fields_by_js_key[key]: value
+                  for key, value in as_dict.items()
+                  if key in fields_by_js_key}
+
+        return kwargs
+
+
+class UntrimmedFieldTableMixin(FieldTableMixin):
+    """Extends :class:`FieldTableMixin` to also derive
+    :meth:`._to_untrimmed_dict() <HighchartsMeta._to_untrimmed_dict>` from ``_FIELDS``,
+    reading each option from its ``_<python_name>`` attribute.
+
+    .. warning::
+
+      Do not use on classes which assemble their untrimmed :class:`dict <python:dict>`
+      by traversing their ancestors with
+      :func:`mro__to_untrimmed_dict() <highcharts_core.utility_functions.mro__to_untrimmed_dict>`,
+      as the traversal would also call the mixin's implementation.
+    """
+
+    __slots__ = ()
+
+    _FIELD_GETTER = staticmethod(lambda obj: ())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('_FIELDS'):
+            getter = attrgetter(*(f'_{name}' for name, _ in cls._FIELDS))
+            if len(cls._FIELDS) == 1:
+                # a single-name attrgetter returns the value rather than a tuple
+                cls._FIELD_GETTER = staticmethod(lambda obj: (getter(obj),))
+            else:
+                cls._FIELD_GETTER = staticmethod(getter)
+
+    def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        untrimmed = {js_key: value
+                     for (_, js_key), value in zip(self._FIELDS, self._FIELD_GETTER(self))
+                     if value is not None}
+
+        return untrimmed
+
+
 class JavaScriptDict(UserDict):
     """Special :class:`dict <python:dict>` class which constructs a JavaScript
     object that can be represented as a string.
@@ -975,9 +1064,15 @@ class JavaScriptDict(UserDict):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
+        for key, value in untrimmed.items():
+            # None -> dropped
+            if value is None:
+                continue
+            # non-empty str / int / float -> as-is
+            if (type(value) is str and value) or type(value) in (int, float):
+                as_dict[key] = value
+                continue
             context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
             # bool -> Boolean
             if isinstance(value, bool):
                 as_dict[key] = value
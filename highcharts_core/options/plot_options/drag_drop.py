@@ -5,24 +5,31 @@ from validator_collection import validators
 
 from highcharts_core import constants, errors
 from highcharts_core.decorators import class_sensitive
-from highcharts_core.metaclasses import HighchartsMeta
+from highcharts_core.metaclasses import HighchartsMeta, UntrimmedFieldTableMixin
+from highcharts_core.utility_functions import validate_string, validate_numeric
 from highcharts_core.utility_classes.gradients import Gradient
 from highcharts_core.utility_classes.patterns import Pattern
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
 
 
-class DragHandle(HighchartsMeta):
+class DragHandle(UntrimmedFieldTableMixin, HighchartsMeta):
     """Options for the drag handles available in column series."""
 
-    def __init__(self, **kwargs):
-        self._class_name = None
-        self._color = None
-        self._cursor = None
-        self._line_color = None
-        self._line_width = None
-        self._path_formatter = None
-        self._z_index = None
+    __slots__ = ('_class_name', '_color', '_cursor', '_line_color', '_line_width',
+                 '_path_formatter', '_z_index')
+
+    # (Python property name, Highcharts JS key) for each option.
+    _FIELDS = (
+        ('class_name', 'className'),
+        ('color', 'color'),
+        ('cursor', 'cursor'),
+        ('line_color', 'lineColor'),
+        ('line_width', 'lineWidth'),
+        ('path_formatter', 'pathFormatter'),
+        ('z_index', 'zIndex'),
+    )
 
+    def __init__(self, **kwargs):
         self.class_name = kwargs.get('class_name', None)
         self.color = kwargs.get('color', None)
         self.cursor = kwargs.get('cursor', None)
@@ -42,7 +49,7 @@ class DragHandle(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        self._class_name = validate_string(value)
 
     @property
     def color(self) -> Optional[str | Gradient | Pattern]:
@@ -112,7 +119,8 @@ class DragHandle(HighchartsMeta):
         if not value:
             self._cursor = None
         else:
-            value = validators.string(value)
+            if not isinstance(value, str):
+                value = validators.string(value)
             value = value.lower()
             if value not in constants.SUPPORTED_CURSOR_VALUES:
                 raise errors.HighchartsValueError(f'cursor expects a valid cursor value. '
@@ -143,9 +151,7 @@ class DragHandle(HighchartsMeta):
 
     @line_width.setter
     def line_width(self, value):
-        self._line_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._line_width = validate_numeric(value, minimum = 0)
 
     @property
     def path_formatter(self) -> Optional[CallbackFunction]:
@@ -172,47 +178,25 @@ class DragHandle(HighchartsMeta):
 
     @z_index.setter
     def z_index(self, value):
-        self._z_index = validators.numeric(value, allow_empty = True)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'path_formatter': as_dict.get('pathFormatter', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'className': self.class_name,
-            'color': self.color,
-            'cursor': self.cursor,
-            'lineColor': self.line_color,
-            'lineWidth': self.line_width,
-            'pathFormatter': self.path_formatter,
-            'zIndex': self.z_index
-        }
-
-        return untrimmed
-
-
-class GuideBoxOptions(HighchartsMeta):
+        self._z_index = validate_numeric(value)
+
+
+class GuideBoxOptions(UntrimmedFieldTableMixin, HighchartsMeta):
     """Style options for the guide box default state."""
 
-    def __init__(self, **kwargs):
-        self._class_name = None
-        self._color = None
-        self._cursor = None
-        self._line_color = None
-        self._line_width = None
-        self._z_index = None
+    __slots__ = ('_class_name', '_color', '_cursor', '_line_color', '_line_width',
+                 '_z_index')
+
+    _FIELDS = (
+        ('class_name', 'className'),
+        ('color', 'color'),
+        ('cursor', 'cursor'),
+        ('line_color', 'lineColor'),
+        ('line_width', 'lineWidth'),
+        ('z_index', 'zIndex'),
+    )
 
+    def __init__(self, **kwargs):
         self.class_name = kwargs.get('class_name', None)
         self.color = kwargs.get('color', None)
         self.cursor = kwargs.get('cursor', None)
@@ -231,7 +215,7 @@ class GuideBoxOptions(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        self._class_name = validate_string(value)
 
     @property
     def color(self) -> Optional[str | Gradient | Pattern]:
@@ -300,7 +284,8 @@ class GuideBoxOptions(HighchartsMeta):
         if not value:
             self._cursor = None
         else:
-            value = validators.string(value)
+            if not isinstance(value, str):
+                value = validators.string(value)
             value = value.lower()
             if value not in constants.SUPPORTED_CURSOR_VALUES:
                 raise errors.HighchartsValueError(f'cursor expects a valid cursor value. '
@@ -331,9 +316,7 @@ class GuideBoxOptions(HighchartsMeta):
 
     @line_width.setter
     def line_width(self, value):
-        self._line_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._line_width = validate_numeric(value, minimum = 0)
 
     @property
     def z_index(self) -> Optional[int | float | Decimal]:
@@ -345,40 +328,20 @@ class GuideBoxOptions(HighchartsMeta):
 
     @z_index.setter
     def z_index(self, value):
-        self._z_index = validators.numeric(value, allow_empty = True)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'className': self.class_name,
-            'color': self.color,
-            'cursor': self.cursor,
-            'lineColor': self.line_color,
-            'lineWidth': self.line_width,
-            'zIndex': self.z_index
-        }
-
-        return untrimmed
-
-
-class GuideBox(HighchartsMeta):
+        self._z_index = validate_numeric(value)
+
+
+class GuideBox(UntrimmedFieldTableMixin, HighchartsMeta):
     """Style options for the guide box. The guide box has one state by default, the
     ``default`` state."""
 
+    __slots__ = ('_default',)
+
+    _FIELDS = (
+        ('default', 'default'),
+    )
+
     def __init__(self, **kwargs):
-        self._default = None
         self.default = kwargs.get('default', None)
 
     @property
@@ -394,21 +357,8 @@ class GuideBox(HighchartsMeta):
     def default(self, value):
         self._default = value
 
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        return {
-            'default': as_dict.get('default', None)
-        }
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'default': self.default
-        }
-
-        return untrimmed
 
-
-class DragDropOptions(HighchartsMeta):
+class DragDropOptions(UntrimmedFieldTableMixin, HighchartsMeta):
     """The draggable-points module allows points to be moved around or modified in the
     chart.
 
@@ -421,21 +371,28 @@ class DragDropOptions(HighchartsMeta):
 
     """
 
-    def __init__(self, **kwargs):
-        self._draggable_x = None
-        self._draggable_y = None
-        self._drag_handle = None
-        self._drag_max_x = None
-        self._drag_max_y = None
-        self._drag_min_x = None
-        self._drag_min_y = None
-        self._drag_precision_x = None
-        self._drag_precision_y = None
-        self._drag_sensitivity = 2
-        self._group_by = None
-        self._guide_box = None
-        self._live_redraw = True
+    __slots__ = ('_draggable_x', '_draggable_y', '_drag_handle', '_drag_max_x',
+                 '_drag_max_y', '_drag_min_x', '_drag_min_y', '_drag_precision_x',
+                 '_drag_precision_y', '_drag_sensitivity', '_group_by', '_guide_box',
+                 '_live_redraw')
+
+    _FIELDS = (
+        ('draggable_x', 'draggableX'),
+        ('draggable_y', 'draggableY'),
+        ('drag_handle', 'dragHandle'),
+        ('drag_max_x', 'dragMaxX'),
+        ('drag_max_y', 'dragMaxY'),
+        ('drag_min_x', 'dragMinX'),
+        ('drag_min_y', 'dragMinY'),
+        ('drag_precision_x', 'dragPrecisionX'),
+        ('drag_precision_y', 'dragPrecisionY'),
+        ('drag_sensitivity', 'dragSensitivity'),
+        ('group_by', 'groupBy'),
+        ('guide_box', 'guideBox'),
+        ('live_redraw', 'liveRedraw'),
+    )
 
+    def __init__(self, **kwargs):
         self.draggable_x = kwargs.get('draggable_x', None)
         self.draggable_y = kwargs.get('draggable_y', None)
         self.drag_handle = kwargs.get('drag_handle', None)
@@ -469,10 +426,10 @@ class DragDropOptions(HighchartsMeta):
 
     @draggable_x.setter
     def draggable_x(self, value):
-        if value is None:
-            self._draggable_x = None
+        if value is None or value is True or value is False:
+            self._draggable_x = value
         else:
-            self._draggable_x = bool(value)
+            self._draggable_x = True if value else False
 
     @property
     def draggable_y(self) -> Optional[bool]:
@@ -489,10 +446,10 @@ class DragDropOptions(HighchartsMeta):
 
     @draggable_y.setter
     def draggable_y(self, value):
-        if value is None:
-            self._draggable_y = None
+        if value is None or value is True or value is False:
+            self._draggable_y = value
         else:
-            self._draggable_y = bool(value)
+            self._draggable_y = True if value else False
 
     @property
     def drag_handle(self) -> Optional[DragHandle]:
@@ -518,7 +475,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_max_x.setter
     def drag_max_x(self, value):
-        self._drag_max_x = validators.numeric(value, allow_empty = True)
+        self._drag_max_x = validate_numeric(value)
 
     @property
     def drag_max_y(self) -> Optional[int | float | Decimal]:
@@ -531,7 +488,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_max_y.setter
     def drag_max_y(self, value):
-        self._drag_max_y = validators.numeric(value, allow_empty = True)
+        self._drag_max_y = validate_numeric(value)
 
     @property
     def drag_min_x(self) -> Optional[int | float | Decimal]:
@@ -544,7 +501,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_min_x.setter
     def drag_min_x(self, value):
-        self._drag_min_x = validators.numeric(value, allow_empty = True)
+        self._drag_min_x = validate_numeric(value)
 
     @property
     def drag_min_y(self) -> Optional[int | float | Decimal]:
@@ -557,7 +514,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_min_y.setter
     def drag_min_y(self, value):
-        self._drag_min_y = validators.numeric(value, allow_empty = True)
+        self._drag_min_y = validate_numeric(value)
 
     @property
     def drag_precision_x(self) -> Optional[int | float | Decimal]:
@@ -573,9 +530,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_precision_x.setter
     def drag_precision_x(self, value):
-        self._drag_precision_x = validators.numeric(value,
-                                                    allow_empty = True,
-                                                    minimum = 0)
+        self._drag_precision_x = validate_numeric(value, minimum = 0)
 
     @property
     def drag_precision_y(self) -> Optional[int | float | Decimal]:
@@ -591,9 +546,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_precision_y.setter
     def drag_precision_y(self, value):
-        self._drag_precision_y = validators.numeric(value,
-                                                    allow_empty = True,
-                                                    minimum = 0)
+        self._drag_precision_y = validate_numeric(value, minimum = 0)
 
     @property
     def drag_sensitivity(self) -> Optional[int | float | Decimal]:
@@ -610,9 +563,7 @@ class DragDropOptions(HighchartsMeta):
 
     @drag_sensitivity.setter
     def drag_sensitivity(self, value):
-        self._drag_sensitivity = validators.numeric(value,
-                                                    allow_empty = True,
-                                                    minimum = 0)
+        self._drag_sensitivity = validate_numeric(value, minimum = 0)
 
     @property
     def group_by(self) -> Optional[str]:
@@ -625,7 +576,7 @@ class DragDropOptions(HighchartsMeta):
 
     @group_by.setter
     def group_by(self, value):
-        self._group_by = validators.string(value, allow_empty = True)
+        self._group_by = validate_string(value)
 
     @property
     def guide_box(self) -> Optional[GuideBox]:
@@ -653,59 +604,24 @@ class DragDropOptions(HighchartsMeta):
 
     @live_redraw.setter
     def live_redraw(self, value):
-        if value is None:
-            self._live_redraw = None
+        if value is None or value is True or value is False:
+            self._live_redraw = value
         else:
-            self._live_redraw = bool(value)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'draggable_x': as_dict.get('draggableX', None),
-            'draggable_y': as_dict.get('draggableY', None),
-            'drag_handle': as_dict.get('dragHandle', None),
-            'drag_max_x': as_dict.get('dragMaxX', None),
-            'drag_max_y': as_dict.get('dragMaxY', None),
-            'drag_min_x': as_dict.get('dragMinX', None),
-            'drag_min_y': as_dict.get('dragMinY', None),
-            'drag_precision_x': as_dict.get('dragPrecisionX', None),
-            'drag_precision_y': as_dict.get('dragPrecisionY', None),
-            'drag_sensitivity': as_dict.get('dragSensitivity', None),
-            'group_by': as_dict.get('groupBy', None),
-            'guide_box': as_dict.get('guideBox', None),
-            'live_redraw': as_dict.get('liveRedraw', None)
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'draggableX': self.draggable_x,
-            'draggableY': self.draggable_y,
-            'dragHandle': self.drag_handle,
-            'dragMaxX': self.drag_max_x,
-            'dragMaxY': self.drag_max_y,
-            'dragMinX': self.drag_min_x,
-            'dragMinY': self.drag_min_y,
-            'dragPrecisionX': self.drag_precision_x,
-            'dragPrecisionY': self.drag_precision_y,
-            'dragSensitivity': self.drag_sensitivity,
-            'groupBy': self.group_by,
-            'guideBox': self.guide_box,
-            'liveRedraw': self.live_redraw
-        }
-
-        return untrimmed
+            self._live_redraw = True if value else False
 
 
 class HighLowDragDropOptions(DragDropOptions):
     """The draggable-points module allows points to be moved around or modified in the
     chart."""
 
-    def __init__(self, **kwargs):
-        self._draggable_high = None
-        self._draggable_low = None
+    __slots__ = ('_draggable_high', '_draggable_low')
 
+    _FIELDS = (
+        ('draggable_high', 'draggableHigh'),
+        ('draggable_low', 'draggableLow'),
+    ) + DragDropOptions._FIELDS
+
+    def __init__(self, **kwargs):
         self.draggable_high = kwargs.get('draggable_high', None)
         self.draggable_low = kwargs.get('draggable_low', None)
 
@@ -730,10 +646,10 @@ class HighLowDragDropOptions(DragDropOptions):
 
     @draggable_high.setter
     def draggable_high(self, value):
-        if value is None:
-            self._draggable_high = None
+        if value is None or value is True or value is False:
+            self._draggable_high = value
         else:
-            self._draggable_high = bool(value)
+            self._draggable_high = True if value else False
 
     @property
     def draggable_low(self) -> Optional[bool]:
@@ -746,68 +662,26 @@ class HighLowDragDropOptions(DragDropOptions):
 
     @draggable_low.setter
     def draggable_low(self, value):
-        if value is None:
-            self._draggable_low = None
+        if value is None or value is True or value is False:
+            self._draggable_low = value
         else:
-            self._draggable_low = bool(value)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'draggable_x': as_dict.get('draggableX', None),
-            'draggable_y': as_dict.get('draggableY', None),
-            'drag_handle': as_dict.get('dragHandle', None),
-            'drag_max_x': as_dict.get('dragMaxX', None),
-            'drag_max_y': as_dict.get('dragMaxY', None),
-            'drag_min_x': as_dict.get('dragMinX', None),
-            'drag_min_y': as_dict.get('dragMinY', None),
-            'drag_precision_x': as_dict.get('dragPrecisionX', None),
-            'drag_precision_y': as_dict.get('dragPrecisionY', None),
-            'drag_sensitivity': as_dict.get('dragSensitivity', None),
-            'group_by': as_dict.get('groupBy', None),
-            'guide_box': as_dict.get('guideBox', None),
-            'live_redraw': as_dict.get('liveRedraw', None),
-
-            'draggable_high': as_dict.get('draggableHigh', None),
-            'draggable_low': as_dict.get('draggableLow', None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'draggableHigh': self.draggable_high,
-            'draggableLow': self.draggable_low,
-            'draggableX': self.draggable_x,
-            'draggableY': self.draggable_y,
-            'dragHandle': self.drag_handle,
-            'dragMaxX': self.drag_max_x,
-            'dragMaxY': self.drag_max_y,
-            'dragMinX': self.drag_min_x,
-            'dragMinY': self.drag_min_y,
-            'dragPrecisionX': self.drag_precision_x,
-            'dragPrecisionY': self.drag_precision_y,
-            'dragSensitivity': self.drag_sensitivity,
-            'groupBy': self.group_by,
-            'guideBox': self.guide_box,
-            'liveRedraw': self.live_redraw
-        }
-
-        return untrimmed
+            self._draggable_low = True if value else False
 
 
 class BoxPlotDragDropOptions(HighLowDragDropOptions):
     """The draggable-points module allows points to be moved around or modified in the
     chart."""
 
-    def __init__(self, **kwargs):
-        self._draggable_high = None
-        self._draggable_low = None
-        self._draggable_q1 = None
-        self._draggable_q3 = None
+    __slots__ = ('_draggable_q1', '_draggable_q3')
 
-        self.draggable_high = kwargs.get('draggable_high', None)
-        self.draggable_low = kwargs.get('draggable_low', None)
+    _FIELDS = DragDropOptions._FIELDS + (
+        ('draggable_high', 'draggableHigh'),
+        ('draggable_low', 'draggableLow'),
+        ('draggable_q1', 'draggableQ1'),
+        ('draggable_q3', 'draggableQ3'),
+    )
+
+    def __init__(self, **kwargs):
         self.draggable_q1 = kwargs.get('draggable_q1', None)
         self.draggable_q3 = kwargs.get('draggable_q3', None)
 
@@ -832,10 +706,10 @@ class BoxPlotDragDropOptions(HighLowDragDropOptions):
 
     @draggable_q1.setter
     def draggable_q1(self, value):
-        if value is None:
-            self._draggable_q1 = None
+        if value is None or value is True or value is False:
+            self._draggable_q1 = value
         else:
-            self._draggable_q1 = bool(value)
+            self._draggable_q1 = True if value else False
 
     @property
     def draggable_q3(self) -> Optional[bool]:
@@ -848,68 +722,23 @@ class BoxPlotDragDropOptions(HighLowDragDropOptions):
 
     @draggable_q3.setter
     def draggable_q3(self, value):
-        if value is None:
-            self._draggable_q3 = None
+        if value is None or value is True or value is False:
+            self._draggable_q3 = value
         else:
-            self._draggable_q3 = bool(value)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'draggable_x': as_dict.get('draggableX', None),
-            'draggable_y': as_dict.get('draggableY', None),
-            'drag_handle': as_dict.get('dragHandle', None),
-            'drag_max_x': as_dict.get('dragMaxX', None),
-            'drag_max_y': as_dict.get('dragMaxY', None),
-            'drag_min_x': as_dict.get('dragMinX', None),
-            'drag_min_y': as_dict.get('dragMinY', None),
-            'drag_precision_x': as_dict.get('dragPrecisionX', None),
-            'drag_precision_y': as_dict.get('dragPrecisionY', None),
-            'drag_sensitivity': as_dict.get('dragSensitivity', None),
-            'group_by': as_dict.get('groupBy', None),
-            'guide_box': as_dict.get('guideBox', None),
-            'live_redraw': as_dict.get('liveRedraw', None),
-
-            'draggable_high': as_dict.get('draggableHigh', None),
-            'draggable_low': as_dict.get('draggableLow', None),
-            'draggable_q1': as_dict.get('draggableQ1', None),
-            'draggable_q3': as_dict.get('draggableQ3', None)
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'draggableX': self.draggable_x,
-            'draggableY': self.draggable_y,
-            'dragHandle': self.drag_handle,
-            'dragMaxX': self.drag_max_x,
-            'dragMaxY': self.drag_max_y,
-            'dragMinX': self.drag_min_x,
-            'dragMinY': self.drag_min_y,
-            'dragPrecisionX': self.drag_precision_x,
-            'dragPrecisionY': self.drag_precision_y,
-            'dragSensitivity': self.drag_sensitivity,
-            'groupBy': self.group_by,
-            'guideBox': self.guide_box,
-            'liveRedraw': self.live_redraw,
-
-            'draggableHigh': self.draggable_high,
-            'draggableLow': self.draggable_low,
-            'draggableQ1': self.draggable_q1,
-            'draggableQ3': self.draggable_q3
-        }
-
-        return untrimmed
+            self._draggable_q3 = True if value else False
 
 
 class BulletDragDropOptions(DragDropOptions):
     """The draggable-points module allows points to be moved around or modified in the
     chart."""
 
-    def __init__(self, **kwargs):
-        self._draggable_target = None
+    __slots__ = ('_draggable_target',)
+
+    _FIELDS = DragDropOptions._FIELDS + (
+        ('draggable_target', 'draggableTarget'),
+    )
 
+    def __init__(self, **kwargs):
         self.draggable_target = kwargs.get('draggable_target', None)
 
         super().__init__(**kwargs)
@@ -933,50 +762,7 @@ class BulletDragDropOptions(DragDropOptions):
 
     @draggable_target.setter
     def draggable_target(self, value):
-        if value is None:
-            self._draggable_target = None
+        if value is None or value is True or value is False:
+            self._draggable_target = value
         else:
-            self._draggable_target = bool(value)
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'draggable_x': as_dict.get('draggableX', None),
-            'draggable_y': as_dict.get('draggableY', None),
-            'drag_handle': as_dict.get('dragHandle', None),
-            'drag_max_x': as_dict.get('dragMaxX', None),
-            'drag_max_y': as_dict.get('dragMaxY', None),
-            'drag_min_x': as_dict.get('dragMinX', None),
-            'drag_min_y': as_dict.get('dragMinY', None),
-            'drag_precision_x': as_dict.get('dragPrecisionX', None),
-            'drag_precision_y': as_dict.get('dragPrecisionY', None),
-            'drag_sensitivity': as_dict.get('dragSensitivity', None),
-            'group_by': as_dict.get('groupBy', None),
-            'guide_box': as_dict.get('guideBox', None),
-            'live_redraw': as_dict.get('liveRedraw', None),
-
-            'draggable_target': as_dict.get('draggableTarget', None)
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'draggableX': self.draggable_x,
-            'draggableY': self.draggable_y,
-            'dragHandle': self.drag_handle,
-            'dragMaxX': self.drag_max_x,
-            'dragMaxY': self.drag_max_y,
-            'dragMinX': self.drag_min_x,
-            'dragMinY': self.drag_min_y,
-            'dragPrecisionX': self.drag_precision_x,
-            'dragPrecisionY': self.drag_precision_y,
-            'dragSensitivity': self.drag_sensitivity,
-            'groupBy': self.group_by,
-            'guideBox': self.guide_box,
-            'liveRedraw': self.live_redraw,
-
-            'draggableTarget': self.draggable_target
-        }
-
-        return untrimmed
+            self._draggable_target = True if value else False
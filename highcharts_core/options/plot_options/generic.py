@@ -298,7 +298,8 @@ class GenericTypeOptions(HighchartsMeta):
         if not value:
             self._cursor = None
         else:
-            value = validators.string(value)
+            if not isinstance(value, str):
+                value = validators.string(value)
             value = value.lower()
             if value not in constants.SUPPORTED_CURSOR_VALUES:
                 raise errors.HighchartsValueError(f'cursor expects a valid cursor value. '
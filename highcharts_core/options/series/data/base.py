@@ -22,6 +22,8 @@ from highcharts_core.options.series.data.accessibility import DataPointAccessibi
 class DataCore(HighchartsMeta):
     """Primary base class for describing a data point."""
 
+    __slots__ = ('_color', '_events', '_id', '_label_rank', '_name')
+
     def __init__(self, **kwargs):
         self._color = None
         self._events = None
@@ -149,6 +151,9 @@ class DataCore(HighchartsMeta):
 class DataBase(DataCore):
     """Extended base class for describing a data point."""
 
+    __slots__ = ('_accessibility', '_class_name', '_color_index', '_custom',
+                 '_description', '_selected')
+
     def __init__(self, **kwargs):
         self._accessibility = None
         self._class_name = None
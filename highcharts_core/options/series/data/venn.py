@@ -5,15 +5,42 @@ from validator_collection import validators, checkers
 
 from highcharts_core import constants, errors
 from highcharts_core.decorators import class_sensitive
+from highcharts_core.metaclasses import UntrimmedFieldTableMixin
+from highcharts_core.utility_functions import validate_string, validate_numeric
 from highcharts_core.options.series.data.base import DataBase
 from highcharts_core.options.series.data.collections import DataPointCollection
 from highcharts_core.options.plot_options.drag_drop import DragDropOptions
 from highcharts_core.utility_classes.data_labels import DataLabel
 
 
-class VennData(DataBase):
+class VennData(UntrimmedFieldTableMixin, DataBase):
     """Data point used to render an area within a Venn Diagram."""
 
+    __slots__ = ('_data_labels', '_drag_drop', '_drilldown', '_sets', '_value')
+
+    # (Python property name, Highcharts JS key) for each option, including those
+    # inherited from DataBase.
+    _FIELDS = (
+        ('data_labels', 'dataLabels'),
+        ('drag_drop', 'dragDrop'),
+        ('drilldown', 'drilldown'),
+
+        ('sets', 'sets'),
+        ('value', 'value'),
+
+        ('accessibility', 'accessibility'),
+        ('class_name', 'className'),
+        ('color', 'color'),
+        ('color_index', 'colorIndex'),
+        ('custom', 'custom'),
+        ('description', 'description'),
+        ('events', 'events'),
+        ('id', 'id'),
+        ('label_rank', 'labelrank'),
+        ('name', 'name'),
+        ('selected', 'selected'),
+    )
+
     def __init__(self, **kwargs):
         self._data_labels = None
         self._drag_drop = None
@@ -75,7 +102,7 @@ class VennData(DataBase):
 
     @drilldown.setter
     def drilldown(self, value):
-        self._drilldown = validators.string(value, allow_empty = True)
+        self._drilldown = validate_string(value)
 
     @property
     def sets(self) -> Optional[List[str]]:
@@ -93,11 +120,17 @@ class VennData(DataBase):
     def sets(self, value):
         if not value:
             self._sets = None
-        else:
-            if checkers.is_iterable(value):
-                self._sets = [validators.string(x) for x in value]
+        elif isinstance(value, str):
+            self._sets = [validators.string(value)]
+        elif isinstance(value, (list, tuple)):
+            if all(type(x) is str and x for x in value):
+                self._sets = list(value)
             else:
-                self._sets = [validators.string(value)]
+                self._sets = [validators.string(x) for x in value]
+        elif checkers.is_iterable(value):
+            self._sets = [validators.string(x) for x in value]
+        else:
+            self._sets = [validators.string(value)]
 
     @property
     def value(self) -> Optional[int | float | Decimal]:
@@ -111,7 +144,7 @@ class VennData(DataBase):
 
     @value.setter
     def value(self, value_):
-        self._value = validators.numeric(value_, allow_empty = True)
+        self._value = validate_numeric(value_)
 
     @classmethod
     def from_list(cls, value):
@@ -125,22 +158,23 @@ class VennData(DataBase):
         elif not checkers.is_iterable(value):
             value = [value]
 
-        collection = []
-        for item in value:
-            if checkers.is_type(item, 'VennData'):
-                as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
-                as_obj = cls()
-            else:
-                raise errors.HighchartsValueError(f'each data point supplied must either '
-                                                  f'be a Venn Data Point or be '
-                                                  f'coercable to one. Could not coerce: '
-                                                  f'{item}')
-            collection.append(as_obj)
+        from_dict = cls.from_dict
+        is_dict = checkers.is_dict
+        enforced_null = constants.EnforcedNullType
+
+        def _coerce(item):
+            if isinstance(item, VennData):
+                return item
+            if isinstance(item, dict) or is_dict(item):
+                return from_dict(item)
+            if item is None or isinstance(item, enforced_null):
+                return cls()
+            raise errors.HighchartsValueError(f'each data point supplied must either '
+                                              f'be a Venn Data Point or be '
+                                              f'coercable to one. Could not coerce: '
+                                              f'{item}')
 
-        return collection
+        return [_coerce(item) for item in value]
 
     @classmethod
     def _get_supported_dimensions(cls) -> List[int]:
@@ -159,67 +193,6 @@ class VennData(DataBase):
         :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
         """
         return VennDataCollection.from_ndarray(value)
-    
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        """Convenience method which returns the keyword arguments used to initialize the
-        class from a Highcharts Javascript-compatible :class:`dict <python:dict>` object.
-
-        :param as_dict: The HighCharts JS compatible :class:`dict <python:dict>`
-          representation of the object.
-        :type as_dict: :class:`dict <python:dict>`
-
-        :returns: The keyword arguments that would be used to initialize an instance.
-        :rtype: :class:`dict <python:dict>`
-
-        """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelrank', None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'drilldown': as_dict.get('drilldown', None),
-
-            'sets': as_dict.get('sets', None),
-            'value': as_dict.get('value', None),
-
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-            'drilldown': self.drilldown,
-
-            'sets': self.sets,
-            'value': self.value,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-        }
-
-        return untrimmed
 
 
 class VennDataCollection(DataPointCollection):
@@ -1,9 +1,12 @@
 """Collection of utility functions used across the library."""
 import csv
+import functools
+import json
 import string
 import random
 import typing
 from collections import UserDict
+from decimal import Decimal
 
 from validator_collection import validators, checkers
 try:
@@ -83,13 +86,23 @@ def get_remaining_mro(cls,
       the MRO for ``cls``.
     :rtype: :class:`list <python:list>` of ``type`` objects
     """
+    return list(_get_remaining_mro(cls, in_cls, method))
+
+
+@functools.lru_cache(maxsize = None)
+def _get_remaining_mro(cls, in_cls, method):
+    """Cached implementation of :func:`get_remaining_mro`. The result depends only on
+    the class hierarchy, so it is computed once per ``(cls, in_cls, method)``.
+
+    :rtype: :class:`tuple <python:tuple>` of ``type`` objects
+    """
     mro = [x for x in cls.mro()
            if hasattr(x, method) and x.__name__ != 'HighchartsMeta']
     if in_cls is None:
-        return mro[1:]
+        return tuple(mro[1:])
     else:
         index = mro.index(in_cls)
-        return mro[(index + 1):]
+        return tuple(mro[(index + 1):])
 
 
 def mro__to_untrimmed_dict(obj, in_cls = None):
@@ -110,9 +123,7 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
     do not repeat for each class
     """
     cls = obj.__class__
-    remaining_mro = get_remaining_mro(cls,
-                                      in_cls = in_cls,
-                                      method = '_to_untrimmed_dict')
+    remaining_mro = _get_remaining_mro(cls, in_cls, '_to_untrimmed_dict')
 
     ancestor_dicts = []
     for x in remaining_mro:
@@ -122,8 +133,7 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
 
     consolidated = {}
     for item in ancestor_dicts:
-        for key in item:
-            consolidated[key] = item[key]
+        consolidated.update(item)
 
     return consolidated
 
@@ -143,35 +153,37 @@ def validate_color(value):
 
     if not value:
         return None
-    elif value.__class__.__name__ == 'EnforcedNullType':
-        return value
-    elif isinstance(value, (Gradient, Pattern)):
-        return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
-        try:
-            value = Gradient.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
-        try:
-            value = Pattern.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
     elif isinstance(value, str):
-        value = validators.string(value)
+        # Only a serialized JSON object can describe a gradient or pattern.
+        if value.lstrip()[:1] != '{':
+            return value
+        if 'linearGradient' in value or 'radialGradient' in value:
+            target_cls = Gradient
+        elif 'pattern' in value:
+            target_cls = Pattern
+        else:
+            return value
+        try:
+            as_dict = json.loads(value)
+        except ValueError:
+            return value
+
+        return target_cls.from_dict(as_dict)
+    elif isinstance(value, (Gradient, Pattern, constants.EnforcedNullType)):
+        pass
+    elif isinstance(value, dict):
+        if 'linearGradient' in value or 'radialGradient' in value:
+            value = Gradient.from_dict(value)
+        elif 'linear_gradient' in value or 'radial_gradient' in value:
+            value = Gradient(**value)
+        elif 'patternOptions' in value or 'pattern' in value:
+            value = Pattern.from_dict(value)
+        elif 'pattern_options' in value:
+            value = Pattern(**value)
+        else:
+            raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                              f'Gradient, or Pattern. Value received '
+                                              f'was: {value}')
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
@@ -180,6 +192,44 @@ def validate_color(value):
     return value
 
 
+def validate_string(value):
+    """Validate ``value`` as an optional string, bypassing the general-purpose validator
+    when ``value`` is already a non-empty :class:`str <python:str>`.
+
+    :param value: The value to validate.
+
+    :returns: The validated value.
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+    """
+    if type(value) is str and value:
+        return value
+
+    return validators.string(value, allow_empty = True)
+
+
+def validate_numeric(value, minimum = None):
+    """Validate ``value`` as an optional number, bypassing the general-purpose validator
+    when ``value`` is already a native number within range.
+
+    :param value: The value to validate.
+
+    :param minimum: The minimum value allowed. Defaults to :obj:`None <python:None>`.
+    :type minimum: numeric or :obj:`None <python:None>`
+
+    :returns: The validated value.
+    :rtype: numeric or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+    if minimum is None:
+        if type(value) in (int, float, Decimal):
+            return value
+    elif type(value) in (int, float) and value >= minimum:
+        return value
+
+    return validators.numeric(value, allow_empty = True, minimum = minimum)
+
+
 def to_camelCase(snake_case):
     """Convert ``snake_case`` to ``camelCase``.
 
@@ -92,6 +92,10 @@ STANDARD_PARAMS = [
           'beforeRegionLabel': 'Before Region',
           'endOfChartMarker': 'End of Chart'
       },
+      'series_type_descriptions': {
+          'boxplot': 'Box plot charts are typically used to display groups of data',
+          'funnel': 'Funnel charts are used to display reduction of data in stages'
+      },
       'sonification': {
           'playAsSoundButtonText': 'Play as Sound',
           'playAsSoundClickAnnouncement': 'Playing as Sound'
@@ -155,3 +159,28 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('as_dict', [
+    {'seriesTypeDescriptions': {'boxplot': 'Box plot'}},
+    {'seriesTypeDescription': {'boxplot': 'Box plot'}},
+    {'series_type_description': {'boxplot': 'Box plot'}},
+])
+def test_series_type_descriptions(as_dict):
+    result = cls.from_dict(as_dict)
+    assert result.series_type_descriptions is not None
+    assert result.series_type_descriptions.boxplot == 'Box plot'
+    assert result.to_dict() == {'seriesTypeDescriptions': {'boxplot': 'Box plot'}}
+
+
+def test__to_untrimmed_dict_cache_invalidated_by_setter():
+    instance = cls(credits = 'first value')
+    assert instance.to_dict() == {'credits': 'first value'}
+
+    instance.credits = 'second value'
+    assert instance.to_dict() == {'credits': 'second value'}
+
+    result = instance._to_untrimmed_dict()
+    result['credits'] = 'mutated'
+    assert instance.credits == 'second value'
+    assert instance._to_untrimmed_dict()['credits'] == 'second value'
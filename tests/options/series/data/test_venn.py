@@ -263,3 +263,24 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ([], None, None),
+    ('A', ['A'], None),
+    (['A', 'B'], ['A', 'B'], None),
+    (('A', 'B'), ['A', 'B'], None),
+    ({'A'}, ['A'], None),
+    (['A', ''], None, ValueError),
+])
+def test_sets(value, expected, error):
+    instance = cls()
+    if not error:
+        instance.sets = value
+        assert instance.sets == expected
+        if isinstance(value, list) and value:
+            assert instance.sets is not value
+    else:
+        with pytest.raises(error):
+            instance.sets = value
@@ -485,3 +485,27 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ('some-series-id', 'some-series-id', None),
+    (123, 123, None),
+    (0, 0, None),
+    (2.0, 2, None),
+
+    (-1, None, (TypeError, ValueError)),
+])
+def test_base_series(value, expected, error):
+    if not error:
+        result = cls(base_series = value)
+        assert result.base_series == expected
+    else:
+        with pytest.raises(error):
+            result = cls(base_series = value)
+
+
+def test_fields_by_js_key_is_read_only():
+    assert cls._FIELDS_BY_JS_KEY['baseSeries'] == 'base_series'
+    with pytest.raises(TypeError):
+        cls._FIELDS_BY_JS_KEY['notAField'] = 'not_a_field'
@@ -229,6 +229,8 @@ def test_validate_types_list(kwargs, error, result_class):
     ('{ "prop": 123 }', None, TestClass),
     # none
     (None, None, TestClass),
+    # instance
+    (TestClass(prop = 123), None, TestClass),
     # list and fails
     ([{ 'prop': 123 }, {'prop': 456 }], errors.HighchartsError, TestClass)
 ])
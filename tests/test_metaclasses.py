@@ -2,7 +2,8 @@
 
 import pytest
 
-from highcharts_core.metaclasses import HighchartsMeta
+from highcharts_core.metaclasses import HighchartsMeta, FieldTableMixin, \
+    UntrimmedFieldTableMixin
 from highcharts_core import constants
 
 from json.decoder import JSONDecodeError
@@ -110,6 +111,7 @@ def test_from_dict(cls, as_dict, error):
         result = cls.from_dict(as_dict)
         assert result is not None
         assert isinstance(result, HighchartsMeta)
+        assert as_dict == original_dict
         print(original_dict)
         if not original_dict:
             assert result.item1 is None
@@ -123,6 +125,18 @@ def test_from_dict(cls, as_dict, error):
             result = cls.from_dict(as_dict)
 
 
+@pytest.mark.parametrize('as_dict, expected', [
+    ({'item1': 123, 'camelCaseItem': 'test'}, 'test'),
+    ({'item1': 123, 'camel_case_item': 'test'}, None),
+])
+def test_from_dict_without_snake_case(as_dict, expected):
+    original_dict = as_dict.copy()
+    result = TestClassCamelCase.from_dict(as_dict, allow_snake_case = False)
+    assert result.item1 == 123
+    assert result.camel_case_item == expected
+    assert as_dict == original_dict
+
+
 @pytest.mark.parametrize('cls, as_json, error', [
     (TestClass, '{"item1": 123, "item2": 456}', None),
     (TestClass, '{}', None),
@@ -197,6 +211,8 @@ def test__to_untrimmed_dict(instance, error):
     ({'item1': test_class_instance, 'item2': None}, 1, None),
     ({'item1': constants.EnforcedNull, 'item2': None}, 1, None),
     ({'item1': {'test': 789}, 'item2': None}, 1, None),
+    ({'item1': 'some-string', 'item2': 1.5, 'item3': 0, 'item4': ''}, 3, None),
+    ({'item1': '2023-01-01T10:00:00', 'item2': None}, 1, None),
     ('not-a-dict', None, AttributeError),
 ])
 def test_trim_dict(untrimmed, expected_keys, error):
@@ -515,4 +531,67 @@ def test_enforced_null_to_json():
     if json_as_bytes:
         assert result == b'{"enforced_null_value":null}'
     else:
-        assert result == '{"enforced_null_value": null}'
\ No newline at end of file
+        assert result == '{"enforced_null_value": null}'
+
+
+class FieldTableTestClass(FieldTableMixin, TestClass):
+    """Class used to test the :class:`FieldTableMixin` functionality."""
+
+    _FIELDS = (
+        ('item1', 'item1'),
+        ('camel_case_item', 'camelCaseItem'),
+    )
+
+
+@pytest.mark.parametrize('as_dict, expected', [
+    ({'item1': 123, 'camelCaseItem': 456}, {'item1': 123, 'camel_case_item': 456}),
+    ({'item1': 123, 'notAField': 456}, {'item1': 123}),
+    ({}, {}),
+])
+def test_field_table_mixin_kwargs(as_dict, expected):
+    result = FieldTableTestClass._get_kwargs_from_dict(as_dict)
+    assert result == expected
+
+
+def test_field_table_mixin_lookup_is_read_only():
+    assert FieldTableTestClass._FIELDS_BY_JS_KEY == {'item1': 'item1',
+                                                     'camelCaseItem': 'camel_case_item'}
+    with pytest.raises(TypeError):
+        FieldTableTestClass._FIELDS_BY_JS_KEY['item2'] = 'item2'
+
+
+class UntrimmedFieldTableTestClass(UntrimmedFieldTableMixin, HighchartsMeta):
+    """Class used to test the :class:`UntrimmedFieldTableMixin` functionality."""
+
+    _FIELDS = (
+        ('item1', 'item1'),
+        ('camel_case_item', 'camelCaseItem'),
+    )
+
+    def __init__(self, **kwargs):
+        self._item1 = kwargs.get('item1', None)
+        self._camel_case_item = kwargs.get('camel_case_item', None)
+
+
+class SingleFieldTestClass(UntrimmedFieldTableMixin, HighchartsMeta):
+    """Class used to test the :class:`UntrimmedFieldTableMixin` with a single field."""
+
+    _FIELDS = (
+        ('item1', 'item1'),
+    )
+
+    def __init__(self, **kwargs):
+        self._item1 = kwargs.get('item1', None)
+
+
+@pytest.mark.parametrize('cls, kwargs, expected', [
+    (UntrimmedFieldTableTestClass,
+     {'item1': 123, 'camel_case_item': 456},
+     {'item1': 123, 'camelCaseItem': 456}),
+    (UntrimmedFieldTableTestClass, {'item1': 123}, {'item1': 123}),
+    (SingleFieldTestClass, {'item1': 123}, {'item1': 123}),
+    (SingleFieldTestClass, {}, {}),
+])
+def test_untrimmed_field_table_mixin(cls, kwargs, expected):
+    instance = cls(**kwargs)
+    assert instance._to_untrimmed_dict() == expected
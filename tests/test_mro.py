@@ -455,3 +455,17 @@ def test_mro_return(cls, exclude_self):
         assert 'ParentA' in result
         assert 'ParentB' in result
         assert 'Grandparent' in result
+
+
+@pytest.mark.parametrize('cls, in_cls, expected', [
+    (Child, None, [ParentA, ParentB, Grandparent]),
+    (Child, ParentA, [ParentB, Grandparent]),
+    (GrandChild, None, [Child, ParentA, ParentB, Grandparent]),
+    (Grandparent, None, []),
+])
+def test_get_remaining_mro(cls, in_cls, expected):
+    result = utility_functions.get_remaining_mro(cls, in_cls = in_cls)
+    assert result == expected
+
+    result.append(None)
+    assert utility_functions.get_remaining_mro(cls, in_cls = in_cls) == expected
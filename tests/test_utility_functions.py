@@ -11,7 +11,9 @@ except ImportError:
 
 from validator_collection import checkers
 
-from highcharts_core import utility_functions, constants
+from highcharts_core import utility_functions, constants, errors
+from highcharts_core.utility_classes.gradients import Gradient
+from highcharts_core.utility_classes.patterns import Pattern
 
 
 @pytest.mark.parametrize('kwargs, expected_column_names, expected_records, error', [
@@ -46,6 +48,70 @@ def test_to_snake_case(camelCase, expected, error):
             result = utility_functions.to_snake_case(camelCase)
 
 
+@pytest.mark.parametrize('value, expected_type, error', [
+    (None, type(None), None),
+    ('', type(None), None),
+    ('#fff', str, None),
+    ('url(#pattern-1)', str, None),
+    ('linearGradient', str, None),
+    ('{"linearGradient": ', str, None),
+    ('[{"linearGradient": {"x1": 0}}]', str, None),
+    (constants.EnforcedNull, constants.EnforcedNullType, None),
+    ({'linearGradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+      'stops': [[0, '#003399'], [1, '#3366AA']]}, Gradient, None),
+    ({'linear_gradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1}}, Gradient, None),
+    ('{"linearGradient": {"x1": 0, "x2": 0, "y1": 0, "y2": 1}}', Gradient, None),
+    (' {"radialGradient": {"cx": 0.5, "cy": 0.5, "r": 0.5}}', Gradient, None),
+    ({'patternOptions': {'width': 10, 'height': 10}}, Pattern, None),
+    ({'pattern_options': {'width': 10, 'height': 10}}, Pattern, None),
+    ('{"patternOptions": {"width": 10, "height": 10}}', Pattern, None),
+
+    ({'not_a_color': 123}, None, errors.HighchartsValueError),
+    (123, None, errors.HighchartsValueError),
+])
+def test_validate_color(value, expected_type, error):
+    if not error:
+        result = utility_functions.validate_color(value)
+        assert isinstance(result, expected_type)
+        if expected_type is str:
+            assert result == value
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_color(value)
+
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ('', None, None),
+    ('some-string', 'some-string', None),
+    (123, None, TypeError),
+])
+def test_validate_string(value, expected, error):
+    if not error:
+        result = utility_functions.validate_string(value)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_string(value)
+
+
+@pytest.mark.parametrize('value, minimum, expected, error', [
+    (None, None, None, None),
+    (123, None, 123, None),
+    (1.5, 0, 1.5, None),
+    ('123', None, 123, None),
+    (-1, 0, None, ValueError),
+    ('not-a-number', None, None, TypeError),
+])
+def test_validate_numeric(value, minimum, expected, error):
+    if not error:
+        result = utility_functions.validate_numeric(value, minimum = minimum)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_numeric(value, minimum = minimum)
+
 if HAS_NUMPY:
     @pytest.mark.parametrize('value, expected_dtype, error', [
         ([1, 2, 3], [np.int32, np.int64], None),